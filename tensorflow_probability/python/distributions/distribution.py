@@ -822,19 +822,42 @@ class Distribution(_BaseDistribution):
 
   def _call_sample_n(self, sample_shape, seed, name, **kwargs):
     """Wrapper around _sample_n."""
+    return self._call_sampler(
+        self._sample_n, sample_shape, seed, name, **kwargs)
+
+  def _call_sampler(self, sampler, sample_shape, seed, name, **kwargs):
+    """Calls `sampler`, a `_sample_n`-like function, for `sample_shape`.
+
+    `sampler(n, seed=seed, **kwargs)` may return a (nested) structure of
+    `Tensor`s, each with leading dimension `n` followed by the batch and event
+    dimensions; each is reshaped to have leading dimensions `sample_shape`.
+
+    Args:
+      sampler: Python `callable` with the signature of `_sample_n`.
+      sample_shape: 0D or 1D `int32` `Tensor`. Shape of the generated samples.
+      seed: Python integer or `tfp.util.SeedStream` instance, for seeding PRNG.
+      name: name to give to the op.
+      **kwargs: Named arguments forwarded to `sampler`.
+
+    Returns:
+      outputs: the structure returned by `sampler`, with each `Tensor` having
+        prepended dimensions `sample_shape`.
+    """
     with self._name_and_control_scope(name):
       if JAX_MODE and seed is None:
         raise ValueError('Must provide JAX PRNGKey as `dist.sample(seed=.)`')
       sample_shape = tf.cast(sample_shape, tf.int32, name='sample_shape')
       sample_shape, n = self._expand_sample_shape_to_vector(
           sample_shape, 'sample_shape')
-      samples = self._sample_n(
-          n, seed=seed() if callable(seed) else seed, **kwargs)
-      batch_event_shape = tf.shape(samples)[1:]
-      final_shape = tf.concat([sample_shape, batch_event_shape], 0)
-      samples = tf.reshape(samples, final_shape)
-      samples = self._set_sample_static_shape(samples, sample_shape)
-      return samples
+      outputs = sampler(n, seed=seed() if callable(seed) else seed, **kwargs)
+
+      def reshape_samples(samples):
+        batch_event_shape = tf.shape(samples)[1:]
+        final_shape = tf.concat([sample_shape, batch_event_shape], 0)
+        samples = tf.reshape(samples, final_shape)
+        return self._set_sample_static_shape(samples, sample_shape)
+
+      return tf.nest.map_structure(reshape_samples, outputs)
 
   def sample(self, sample_shape=(), seed=None, name='sample', **kwargs):
     """Generate samples of the specified shape.
@@ -23,14 +23,14 @@ from __future__ import print_function
 import numpy as np
 import tensorflow.compat.v2 as tf
 
-from tensorflow_probability.python import math as tfp_math
 from tensorflow_probability.python.distributions import distribution
 from tensorflow_probability.python.internal import assert_util
 from tensorflow_probability.python.internal import dtype_util
 from tensorflow_probability.python.internal import prefer_static
 from tensorflow_probability.python.internal import reparameterization
+from tensorflow_probability.python.internal import samplers
 from tensorflow_probability.python.internal import tensor_util
-from tensorflow_probability.python.util.seed_stream import SeedStream
+from tensorflow_probability.python.internal import tensorshape_util
 
 
 __all__ = [
@@ -70,9 +70,20 @@ class DoublesidedMaxwell(distribution.Distribution):
   therefore the same up to a factor of 0.5.
 
   It has several methods for generating random variates from it. The version
-  here uses 3 Gaussian variates and a uniform variate to generate the samples
-  The sampling path is:
-  mu + sigma* sgn(U-0.5)* sqrt(X^2 + Y^2 + Z^2) U~Unif; X,Y,Z ~N(0,1)
+  here uses 3 Gaussian variates to generate the samples. The sampling path is:
+  mu + sigma* sgn(X)* sqrt(X^2 + Y^2 + Z^2) X,Y,Z ~N(0,1)
+
+  Since `X` is symmetric about zero, `sgn(X)` is independent of `|X|`, `Y` and
+  `Z`, hence of the magnitude `sqrt(X^2 + Y^2 + Z^2)`, so no additional uniform
+  variate is needed to draw the sign.
+
+  Drawing many samples in one call, e.g., `dist.sample(1000)`, is much cheaper
+  than calling `dist.sample()` in a Python loop: each call has a fixed dispatch
+  overhead which, for small sample shapes, dwarfs the sampling arithmetic.
+
+  Besides a Python integer, `seed` may be an integer `Tensor` of shape `[2]`.
+  Sampling is then stateless, i.e., the samples are a deterministic function of
+  `seed`, and contains no stateful ops, so it compiles under XLA.
 
   In the sampling process above, the random variates generated by
   sqrt(X^2 + Y^2 + Z^2) are samples from the one-sided Maxwell
@@ -100,6 +111,9 @@ class DoublesidedMaxwell(distribution.Distribution):
 
   # Get 3 samples, returning a 3 x 2 tensor.
   dist.sample([3])
+
+  # Get the same 3 samples every time, using a stateless seed.
+  dist.sample([3], seed=tf.constant([4, 2]))
   ```
 
   #### References
@@ -117,7 +131,8 @@ class DoublesidedMaxwell(distribution.Distribution):
                scale,
                validate_args=False,
                allow_nan_stats=True,
-               name='doublesided_maxwell'):
+               name='doublesided_maxwell',
+               sample_dtype=None):
     """Construct a Double-sided Maxwell distribution with `scale`.
 
     Args:
@@ -135,6 +150,17 @@ class DoublesidedMaxwell(distribution.Distribution):
         Default value: `True`.
       name: Python `str` name prefixed to Ops created by this class.
         Default value: 'doublesided_maxwell'.
+      sample_dtype: Optional floating `dtype` in which the Gaussian variates
+        and the Maxwell magnitude are computed when sampling, e.g.,
+        `tf.bfloat16` or `tf.float16`. The magnitude is cast to `dtype` before
+        `loc` and `scale` are applied. A narrower type halves the memory
+        traffic of the sampler at the cost of precision: `tf.bfloat16` keeps
+        only 8 bits of mantissa, so the samples are quantized and their tails
+        are truncated. Must not be used where samples need full precision.
+        Default value: `None` (i.e., sample in `dtype`).
+
+    Raises:
+      TypeError: if `sample_dtype` is not a floating point type.
     """
     parameters = dict(locals())
     with tf.name_scope(name) as name:
@@ -144,6 +170,21 @@ class DoublesidedMaxwell(distribution.Distribution):
           value=loc, name='loc', dtype=dtype)
       self._scale = tensor_util.convert_nonref_to_tensor(
           value=scale, name='scale', dtype=dtype)
+      # A non-variable `scale` is already a `Tensor`, so methods use it
+      # directly rather than calling `tf.convert_to_tensor` each time.
+      self._scale_tensor = (
+          None if tensor_util.is_ref(self._scale) else self._scale)
+      self._sample_dtype = (
+          None if sample_dtype is None else tf.as_dtype(sample_dtype))
+      if (self._sample_dtype is not None and
+          not dtype_util.is_floating(self._sample_dtype)):
+        raise TypeError('Argument `sample_dtype` must be float type.')
+      # Constants are kept as NumPy scalars of the distribution's dtype: they
+      # are valid in any graph and substrate, and need no promotion when they
+      # meet a `Tensor`.
+      np_dtype = dtype_util.as_numpy_dtype(dtype)
+      self._half_log_two_pi = np_dtype(0.5 * np.log(2. * np.pi))
+      self._sqrt_three = np_dtype(np.sqrt(3.))
 
     super(DoublesidedMaxwell, self).__init__(
         dtype=self._scale.dtype,
@@ -173,10 +214,21 @@ class DoublesidedMaxwell(distribution.Distribution):
     """Distribution parameter for the scale."""
     return self._scale
 
+  @property
+  def sample_dtype(self):
+    """`dtype` in which the sampler computes the Maxwell magnitude."""
+    return self.dtype if self._sample_dtype is None else self._sample_dtype
+
   def _batch_shape_tensor(self, loc=None, scale=None):
-    return tf.broadcast_dynamic_shape(
-        tf.shape(self.loc if loc is None else loc),
-        tf.shape(self.scale if scale is None else scale))
+    batch_shape = prefer_static.broadcast_shape(
+        prefer_static.shape(self.loc if loc is None else loc),
+        prefer_static.shape(self.scale if scale is None else scale))
+    if isinstance(batch_shape, tf.TensorShape):
+      # Statically known shapes are broadcast to a `TensorShape`; return it as
+      # an `int32` vector like the dynamic path, rather than leaving the dtype
+      # to be inferred (e.g., as `float64` for a scalar batch).
+      return np.int32(tensorshape_util.as_list(batch_shape))
+    return batch_shape
 
   def _batch_shape(self):
     return tf.broadcast_static_shape(self.loc.shape, self.scale.shape)
@@ -188,47 +240,119 @@ class DoublesidedMaxwell(distribution.Distribution):
     return tf.TensorShape([])
 
   def _log_prob(self, x):
-    scale = tf.convert_to_tensor(self.scale)
+    scale = self._convert_scale()
     z = self._z(x, scale=scale)
 
-    square_z = tf.square(z)
-    log_unnormalized_prob = -0.5 * square_z + tf.math.log(square_z)
-    log_normalization = 0.5 * np.log(2. * np.pi) + tf.math.log(scale)
+    # Use `2 * log|z|` rather than `log(z**2)`; the latter needs an extra pass
+    # over `z**2` and is `-inf` wherever `z**2` underflows.
+    log_unnormalized_prob = -0.5 * tf.square(z) + 2. * tf.math.log(tf.abs(z))
+    # All constant and `scale`-dependent terms are combined at batch shape so
+    # only one subtraction remains at the shape of `x`.
+    log_normalization = self._half_log_two_pi + tf.math.log(scale)
     return log_unnormalized_prob - log_normalization
 
+  def _convert_scale(self):
+    """Returns `scale` as a `Tensor`, reading it anew if it is a variable."""
+    if self._scale_tensor is None:
+      return tf.convert_to_tensor(self.scale)
+    return self._scale_tensor
+
   def _z(self, x, scale=None):
     """Standardize input `x` to a standard maxwell."""
     with tf.name_scope('standardize'):
-      return (x - self.loc) / (self.scale if scale is None else scale)
+      # The reciprocal is taken at batch shape, so only a multiply remains at
+      # the (typically much larger) shape of `x`.
+      return (x - self.loc) * tf.math.reciprocal(
+          self.scale if scale is None else scale)
 
   def _sample_n(self, n, seed=None):
+    samples, _ = self._sample_n_and_maxwell_rvs(
+        n,
+        loc=tf.convert_to_tensor(self.loc),
+        scale=self._convert_scale(),
+        seed=seed)
+    return samples
+
+  def _sample_n_and_maxwell_rvs(self, n, loc, scale, seed=None):
+    """Returns `n` samples and their one-sided Maxwell magnitudes, `|z|`."""
     # Generate samples using:
-    # mu + sigma* sgn(U-0.5)* sqrt(X^2 + Y^2 + Z^2) U~Unif; X,Y,Z ~N(0,1)
-    seed = SeedStream(seed, salt='DoublesidedMaxwell')
+    # mu + sigma* sgn(X)* sqrt(X^2 + Y^2 + Z^2) X,Y,Z ~N(0,1)
+
+    # Prepend `[3, n]` to the batch shape with a single concat; when the batch
+    # shape is static this is computed in NumPy and emits no ops. The cast pins
+    # the static result to `int32` (NumPy would otherwise infer `int64`); on
+    # the dynamic path the shape is already `int32`, so it is a no-op.
+    shape = prefer_static.cast(
+        prefer_static.concat(
+            [[3, n], self._batch_shape_tensor(loc=loc, scale=scale)], axis=0),
+        tf.int32)
+
+    # Generate one-sided Maxwell variables by using 3 Gaussian variates. They
+    # are drawn with a single RNG call along a new leading axis, so the
+    # magnitude is the Euclidean norm over that (outermost) axis. This is one
+    # vectorized native kernel rather than separate square, add and sqrt ops,
+    # and it never reduces over a minor axis of size 3. The draw is stateless,
+    # so apart from sanitizing `seed` the sampler has no stateful ops.
+    norm_rvs = tf.random.stateless_normal(
+        shape=shape,
+        seed=samplers.sanitize_seed(seed, salt='DoublesidedMaxwell'),
+        dtype=self.sample_dtype)
+    maxwell_rvs = tf.cast(
+        tf.math.reduce_euclidean_norm(norm_rvs, axis=0), self.dtype)
+
+    # The sign of `X` is independent of the magnitude, so use it to make the
+    # variates symmetric. Selecting on it avoids drawing, casting and
+    # multiplying by a separate Rademacher variate. The sign is folded into
+    # `scale` (negated at batch shape only) so that the sample-shaped tail is
+    # a single multiply-add.
+    signed_scale = tf.where(norm_rvs[0] < 0., -scale, scale)
+    return signed_scale * maxwell_rvs + loc, maxwell_rvs
+
+  def experimental_sample_and_log_prob(self, sample_shape=(), seed=None,
+                                       name='sample_and_log_prob'):
+    """Generate samples and their log probability densities.
+
+    This is equivalent to
+
+    ```python
+    samples = dist.sample(sample_shape, seed=seed)
+    log_prob = dist.log_prob(samples)
+    ```
+
+    but cheaper: the standardized magnitude `|z|` of each sample is a byproduct
+    of sampling, so `samples` need not be standardized again to evaluate the
+    density.
 
-    loc = tf.convert_to_tensor(self.loc)
-    scale = tf.convert_to_tensor(self.scale)
-    shape = prefer_static.pad(
-        self._batch_shape_tensor(loc=loc, scale=scale),
-        paddings=[[1, 0]], constant_values=n)
-
-    # Generate one-sided Maxwell variables by using 3 Gaussian variates
-    norm_rvs = tf.random.normal(
-        shape=prefer_static.pad(shape, paddings=[[0, 1]], constant_values=3),
-        dtype=self.dtype,
-        seed=seed())
-    maxwell_rvs = tf.norm(norm_rvs, axis=-1)
-
-    # Generate random signs for the symmetric variates.
-    random_sign = tfp_math.random_rademacher(shape, seed=seed())
-    sampled = random_sign * maxwell_rvs * scale + loc
-    return sampled
+    Args:
+      sample_shape: 0D or 1D `int32` `Tensor`. Shape of the generated samples.
+      seed: Python integer, `tfp.util.SeedStream` instance, or integer `Tensor`
+        of shape `[2]`, for seeding PRNG.
+      name: name to give to the op.
+
+    Returns:
+      samples: a `Tensor` with prepended dimensions `sample_shape`.
+      log_prob: a `Tensor` of the same shape as `samples`, holding the log
+        probability density of each sample.
+    """
+    return self._call_sampler(
+        self._sample_n_and_log_prob, sample_shape, seed, name)
+
+  def _sample_n_and_log_prob(self, n, seed=None):
+    scale = self._convert_scale()
+    samples, maxwell_rvs = self._sample_n_and_maxwell_rvs(
+        n, loc=tf.convert_to_tensor(self.loc), scale=scale, seed=seed)
+    log_prob = (-0.5 * tf.square(maxwell_rvs) + 2. * tf.math.log(maxwell_rvs)
+                - (self._half_log_two_pi + tf.math.log(scale)))
+    return samples, log_prob
 
   def _mean(self):
-    return self.loc * tf.ones_like(self.scale)
+    loc = tf.convert_to_tensor(self.loc)
+    return tf.broadcast_to(loc, self._batch_shape_tensor(loc=loc))
 
   def _stddev(self):
-    return np.sqrt(3.) * self.scale * tf.ones_like(self.loc)
+    scale = self._convert_scale()
+    return tf.broadcast_to(self._sqrt_three * scale,
+                           self._batch_shape_tensor(scale=scale))
 
   def _parameter_control_dependencies(self, is_init):
     assertions = []
@@ -249,7 +373,11 @@ class DoublesidedMaxwell(distribution.Distribution):
       return []
 
     if is_init != tensor_util.is_ref(self.scale):
-      assertions.append(assert_util.assert_positive(
-          self.scale, message='Argument `scale` must be positive.'))
+      # A constant `scale` that is known to be positive needs no runtime check.
+      scale_ = (None if tensor_util.is_ref(self.scale)
+                else tf.get_static_value(self.scale))
+      if scale_ is None or not np.all(scale_ > 0.):
+        assertions.append(assert_util.assert_positive(
+            self.scale, message='Argument `scale` must be positive.'))
 
     return assertions
@@ -74,6 +74,58 @@ class DoublesidedMaxwellTest(test_util.TestCase):
         stats.maxwell.logpdf(np.abs(x), loc, scale) - np.log(2))
     self.assertAllClose(expected_log_prob, log_prob)
 
+  def testDoublesidedMaxwellLogPDFSymmetric(self):
+    loc = 2.
+    scale = 3.
+    x = np.linspace(0.1, 10., 20).astype(np.float32)
+
+    dsmaxwell = tfd.DoublesidedMaxwell(loc=loc, scale=scale, validate_args=True)
+    [log_prob_right_, log_prob_left_] = self.evaluate([
+        dsmaxwell.log_prob(loc + x), dsmaxwell.log_prob(loc - x)])
+    expected_log_prob = stats.maxwell.logpdf(x, 0., scale) - np.log(2)
+    self.assertAllClose(expected_log_prob, log_prob_right_, rtol=1e-5)
+    self.assertAllClose(expected_log_prob, log_prob_left_, rtol=1e-5)
+
+  def testDoublesidedMaxwellLogPDFNearLoc(self):
+    # In float32, `z**2` underflows to zero here but `log|z|` does not.
+    x = np.array([-1e-25, 1e-25, 1e-30], dtype=np.float32)
+    dsmaxwell = tfd.DoublesidedMaxwell(loc=0., scale=1., validate_args=True)
+    log_prob_ = self.evaluate(dsmaxwell.log_prob(x))
+    self.assertAllFinite(log_prob_)
+    expected_log_prob = (
+        2. * np.log(np.abs(x.astype(np.float64))) - 0.5 * np.log(2. * np.pi))
+    self.assertAllClose(expected_log_prob, log_prob_, rtol=1e-6)
+
+  def testDoublesidedMaxwellLogPDFGradientThroughScale(self):
+    loc = 0.
+    scale = tf.Variable(2.)
+    x = np.array([-3., 1., 4.], dtype=np.float32)
+    dsmaxwell = tfd.DoublesidedMaxwell(loc=loc, scale=scale, validate_args=True)
+    self.evaluate([v.initializer for v in dsmaxwell.variables])
+    with tf.GradientTape() as tape:
+      log_prob = dsmaxwell.log_prob(x)
+    grad = tape.gradient(log_prob, scale)
+    # d/dscale log_prob(x) = (z**2 - 3) / scale.
+    z = (x - loc) / 2.
+    self.assertAllClose(np.sum((z**2 - 3.) / 2.), self.evaluate(grad))
+
+    # Mutating `scale` is reflected in subsequent `log_prob` calls.
+    self.evaluate(scale.assign(3.))
+    expected_log_prob = stats.maxwell.logpdf(np.abs(x), loc, 3.) - np.log(2)
+    self.assertAllClose(
+        expected_log_prob, self.evaluate(dsmaxwell.log_prob(x)), rtol=1e-5)
+
+  def testDoublesidedMaxwellLogPDFGradientThroughWatchedScale(self):
+    x = np.array([-3., 1., 4.], dtype=np.float32)
+    dsmaxwell = tfd.DoublesidedMaxwell(loc=0., scale=2., validate_args=True)
+    with tf.GradientTape() as tape:
+      tape.watch(dsmaxwell.scale)
+      log_prob = dsmaxwell.log_prob(x)
+    grad = tape.gradient(log_prob, dsmaxwell.scale)
+    # d/dscale log_prob(x) = (z**2 - 3) / scale.
+    z = x / 2.
+    self.assertAllClose(np.sum((z**2 - 3.) / 2.), self.evaluate(grad))
+
   def testInvalidScale(self):
     scale = [-.01, 0., 2.]
     with self.assertRaisesOpError('Argument `scale` must be positive.'):
@@ -81,6 +133,18 @@ class DoublesidedMaxwellTest(test_util.TestCase):
           loc=0., scale=scale, validate_args=True)
       self.evaluate(dsmaxwell.scale)
 
+  def testConstantPositiveScaleNeedsNoAssertion(self):
+    dsmaxwell = tfd.DoublesidedMaxwell(
+        loc=0., scale=[0.5, 2.], validate_args=True)
+    self.assertEmpty(dsmaxwell._parameter_control_dependencies(is_init=True))
+
+  def testDoublesidedMaxwellSampleScalarBatch(self):
+    dsmaxwell = tfd.DoublesidedMaxwell(loc=0., scale=1., validate_args=True)
+    samples_ = self.evaluate(dsmaxwell.sample(5, seed=tf.constant([4, 2])))
+    self.assertEqual((5,), samples_.shape)
+    self.assertEqual((), self.evaluate(dsmaxwell.mean()).shape)
+    self.assertEqual((), self.evaluate(dsmaxwell.stddev()).shape)
+
   @parameterized.named_parameters(
       ('test1', 4.0, 1.0),
       ('test2', 2.0, 3.0))
@@ -98,6 +162,107 @@ class DoublesidedMaxwellTest(test_util.TestCase):
     self.assertAllClose(np.mean(samples_), mean_, atol=0., rtol=0.1)
     self.assertAllClose(np.var(samples_), variance_, atol=0., rtol=0.1)
 
+  def testDoublesidedMaxwellSampleSymmetric(self):
+    n = int(100e3)
+    dsmaxwell = tfd.DoublesidedMaxwell(loc=0., scale=1., validate_args=True)
+    samples_ = self.evaluate(dsmaxwell.sample(n, seed=100))
+
+    # Signs are fair coin flips, independent of the one-sided Maxwell magnitude.
+    positive = samples_ > 0.
+    maxwell_mean = stats.maxwell.mean()
+    self.assertAllClose(0.5, np.mean(positive), atol=0.01, rtol=0.)
+    self.assertAllClose(
+        maxwell_mean, np.mean(samples_[positive]), atol=0., rtol=0.02)
+    self.assertAllClose(
+        maxwell_mean, np.mean(-samples_[~positive]), atol=0., rtol=0.02)
+
+  def testDoublesidedMaxwellStatelessSample(self):
+    dsmaxwell = tfd.DoublesidedMaxwell(loc=1., scale=2., validate_args=True)
+    [samples_1_, samples_2_, samples_3_] = self.evaluate([
+        dsmaxwell.sample(10, seed=tf.constant([4, 2])),
+        dsmaxwell.sample(10, seed=tf.constant([4, 2])),
+        dsmaxwell.sample(10, seed=tf.constant([4, 3]))])
+    self.assertAllEqual(samples_1_, samples_2_)
+    self.assertFalse(np.any(samples_1_ == samples_3_))
+
+  def testDoublesidedMaxwellSampleLocationScale(self):
+    loc = np.array([-1., 0., 3.], dtype=np.float32)
+    scale = np.array([0.5, 1., 2.], dtype=np.float32)
+    standard = tfd.DoublesidedMaxwell(
+        loc=np.zeros(3, np.float32), scale=np.ones(3, np.float32),
+        validate_args=True)
+    dsmaxwell = tfd.DoublesidedMaxwell(loc=loc, scale=scale, validate_args=True)
+    seed = tf.constant([4, 2])
+    [standard_samples_, samples_] = self.evaluate([
+        standard.sample(10, seed=seed), dsmaxwell.sample(10, seed=seed)])
+    self.assertAllClose(loc + scale * standard_samples_, samples_)
+
+  def testDoublesidedMaxwellSampleShapeScalarBatch(self):
+    dsmaxwell = tfd.DoublesidedMaxwell(loc=1., scale=2., validate_args=True)
+    samples = dsmaxwell.sample([4, 2], seed=tf.constant([4, 2]))
+    self.assertEqual((4, 2), self.evaluate(samples).shape)
+    n = tf.constant(3)
+    samples = dsmaxwell.sample(n, seed=tf.constant([4, 2]))
+    self.assertEqual((3,), self.evaluate(samples).shape)
+
+  def testDoublesidedMaxwellSampleNumpyIntSeed(self):
+    dsmaxwell = tfd.DoublesidedMaxwell(loc=1., scale=2., validate_args=True)
+    samples = dsmaxwell.sample(3, seed=np.int64(5))
+    self.assertEqual((3,), self.evaluate(samples).shape)
+
+  def testDoublesidedMaxwellSampleFloat64(self):
+    dsmaxwell = tfd.DoublesidedMaxwell(
+        loc=np.float64(1.), scale=np.float64(2.), validate_args=True)
+    samples = dsmaxwell.sample(10, seed=100)
+    self.assertEqual(tf.float64, samples.dtype)
+    self.assertEqual((10,), self.evaluate(samples).shape)
+
+  def testDoublesidedMaxwellSampleDtype(self):
+    dsmaxwell = tfd.DoublesidedMaxwell(
+        loc=1., scale=2., sample_dtype=tf.float16, validate_args=True)
+    self.assertEqual(tf.float16, dsmaxwell.sample_dtype)
+    samples = dsmaxwell.sample(10000, seed=tf.constant([4, 2]))
+    self.assertEqual(tf.float32, samples.dtype)
+    samples_ = self.evaluate(samples)
+    self.assertAllClose(1., np.mean(samples_), atol=0.1, rtol=0.)
+    self.assertAllClose(
+        2. * np.sqrt(3.), np.std(samples_), atol=0., rtol=0.02)
+
+  def testPositionalArgsAfterScale(self):
+    dsmaxwell = tfd.DoublesidedMaxwell(0., 1., True)
+    self.assertTrue(dsmaxwell.validate_args)
+    self.assertEqual(tf.float32, dsmaxwell.sample_dtype)
+
+  def testInvalidSampleDtype(self):
+    with self.assertRaisesRegexp(TypeError, '`sample_dtype` must be float'):
+      tfd.DoublesidedMaxwell(loc=0., scale=1., sample_dtype=tf.int32)
+
+  def testDoublesidedMaxwellSampleAndLogProb(self):
+    dsmaxwell = tfd.DoublesidedMaxwell(
+        loc=[-1., 0., 3.], scale=[0.5, 1., 2.], validate_args=True)
+    samples, log_prob = dsmaxwell.experimental_sample_and_log_prob(
+        [5, 2], seed=tf.constant([4, 2]))
+    [samples_, log_prob_, expected_samples_, expected_log_prob_] = (
+        self.evaluate([
+            samples, log_prob,
+            dsmaxwell.sample([5, 2], seed=tf.constant([4, 2])),
+            dsmaxwell.log_prob(samples)]))
+    self.assertEqual((5, 2, 3), log_prob_.shape)
+    self.assertAllEqual(expected_samples_, samples_)
+    self.assertAllClose(expected_log_prob_, log_prob_, rtol=1e-5)
+
+  def testDoublesidedMaxwellSampleAndLogProbScalarBatch(self):
+    dsmaxwell = tfd.DoublesidedMaxwell(loc=1., scale=2., validate_args=True)
+    for seed in (test_util.test_seed(),
+                 tfp.util.SeedStream(test_util.test_seed(), salt='test')):
+      samples, log_prob = dsmaxwell.experimental_sample_and_log_prob(
+          [4, 2], seed=seed)
+      [samples_, log_prob_, expected_log_prob_] = self.evaluate([
+          samples, log_prob, dsmaxwell.log_prob(samples)])
+      self.assertEqual((4, 2), samples_.shape)
+      self.assertEqual((4, 2), log_prob_.shape)
+      self.assertAllClose(expected_log_prob_, log_prob_, rtol=1e-5)
+
   def testDoublesidedMaxwellMean(self):
     # loc will be broadcast to [7, 7, 7]
     loc = [7.]
@@ -49,7 +49,7 @@ DISABLED_DISTS = ('joint_distribution', 'gaussian_process',
                   'variational_gaussian_process', 'von_mises')
 LIBS = ('bijectors', 'distributions', 'math', 'stats', 'util.seed_stream')
 INTERNALS = ('assert_util', 'distribution_util', 'dtype_util',
-             'hypothesis_testlib', 'prefer_static', 'special_math',
+             'hypothesis_testlib', 'prefer_static', 'samplers', 'special_math',
              'tensor_util', 'test_combinations', 'test_util')
 
 
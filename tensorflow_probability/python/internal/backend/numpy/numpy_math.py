@@ -115,7 +115,7 @@ __all__ = [
     'reciprocal',
     'reduce_all',
     'reduce_any',
-    # 'reduce_euclidean_norm',
+    'reduce_euclidean_norm',
     'reduce_logsumexp',
     'reduce_max',
     'reduce_mean',
@@ -617,10 +617,11 @@ reduce_any = utils.copy_docstring(
     lambda input_tensor, axis=None, keepdims=False, name=None: (  # pylint: disable=g-long-lambda
         np.any(input_tensor, _astuple(axis), keepdims=keepdims)))
 
-# reduce_euclidean_norm = utils.copy_docstring(
-#     tf.math.reduce_euclidean_norm,
-#     lambda input_tensor, axis=None, keepdims=False, name=None: (
-#         np.reduce_euclidean_norm))
+reduce_euclidean_norm = utils.copy_docstring(
+    tf.math.reduce_euclidean_norm,
+    lambda input_tensor, axis=None, keepdims=False, name=None: (  # pylint: disable=g-long-lambda
+        np.sqrt(np.sum(np.square(input_tensor), _astuple(axis),
+                       keepdims=keepdims))))
 
 reduce_logsumexp = utils.copy_docstring(
     tf.math.reduce_logsumexp,
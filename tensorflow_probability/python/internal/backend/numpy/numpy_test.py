@@ -395,6 +395,7 @@ NUMPY_TEST_CASES = [
                 dtype=np.bool,
                 elements=hps.booleans()))
     ]),
+    TestCase('math.reduce_euclidean_norm', [array_axis_tuples()]),
     TestCase('math.reduce_logsumexp', [array_axis_tuples()]),
     TestCase('math.reduce_max', [array_axis_tuples()]),
     TestCase('math.reduce_mean', [array_axis_tuples()]),
@@ -34,6 +34,7 @@ __all__ = [
     'gamma',
     'normal',
     'poisson',
+    'stateless_normal',
     'uniform',
     # 'all_candidate_sampler',
     # 'experimental',
@@ -43,7 +44,6 @@ __all__ = [
     # 'set_seed',
     # 'shuffle',
     # 'stateless_categorical',
-    # 'stateless_normal',
     # 'stateless_truncated_normal',
     # 'stateless_uniform',
     # 'truncated_normal',
@@ -134,6 +134,23 @@ def _poisson(shape, lam, dtype=tf.float32, seed=None,
   return rng.poisson(lam=lam, size=shape).astype(dtype)
 
 
+def _stateless_rng(seed):
+  return np.random.RandomState(np.array(seed).astype(np.uint32))
+
+
+def _stateless_normal(shape, seed, mean=0.0, stddev=1.0, dtype=tf.float32,
+                      name=None):  # pylint: disable=unused-argument
+  rng = _stateless_rng(seed)
+  dtype = utils.common_dtype([mean, stddev], dtype_hint=dtype)
+  shape = _shape([mean, stddev], shape)
+  return rng.normal(loc=mean, scale=stddev, size=shape).astype(dtype)
+
+
+def _stateless_normal_jax(shape, seed, mean=0.0, stddev=1.0, dtype=tf.float32,
+                          name=None):  # pylint: disable=unused-argument
+  return _normal_jax(shape, mean=mean, stddev=stddev, dtype=dtype, seed=seed)
+
+
 def _uniform(shape, minval=0, maxval=None, dtype=tf.float32, seed=None,
              name=None):  # pylint: disable=unused-argument
   rng = np.random if seed is None else np.random.RandomState(seed & 0xffffffff)
@@ -171,5 +188,9 @@ poisson = utils.copy_docstring(
     tf.random.poisson,
     _poisson)
 
+stateless_normal = utils.copy_docstring(
+    tf.random.stateless_normal,
+    _stateless_normal_jax if JAX_MODE else _stateless_normal)
+
 uniform = utils.copy_docstring(tf.random.uniform,
                                _uniform_jax if JAX_MODE else _uniform)
@@ -0,0 +1,110 @@
+# Copyright 2019 The TensorFlow Probability Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Seed handling for stateless random samplers."""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import hashlib
+
+# Dependency imports
+import numpy as np
+import six
+import tensorflow.compat.v2 as tf
+
+from tensorflow_probability.python.internal import dtype_util
+from tensorflow_probability.python.internal import tensorshape_util
+
+
+__all__ = [
+    'sanitize_seed',
+]
+
+
+JAX_MODE = False
+
+SEED_DTYPE = np.uint32 if JAX_MODE else np.int32
+
+
+def sanitize_seed(seed, salt=None, name=None):
+  """Maps a seed to a `Tensor` usable by `tf.random.stateless_*` samplers.
+
+  A Python `int` seed (or `None`) is used to seed a single draw of two integers
+  from the stateful `tf.random.uniform`. The resulting stateless seed therefore
+  has the same semantics as the stateful samplers it replaces: it is
+  reproducible given graph- and op-level seeds, and differs across repeated
+  `Session.run` or eager calls. A `Tensor` seed is taken to already be a
+  stateless seed and is passed through.
+
+  If `salt` is given, a Python `int` seed is first hashed together with
+  `salt`, in the manner of `SeedStream`, so that callers seeded with the same
+  `int` draw independent streams without constructing a `SeedStream`. The
+  hashed value differs from what `SeedStream(seed, salt)()` returns. `None`
+  and `Tensor` seeds are unaffected; a `PRNGKey` has the salt folded in.
+
+  Args:
+    seed: `None`, a Python or NumPy integer, or an integer `Tensor` of shape
+      `[2]`. In JAX, a `PRNGKey` or a Python or NumPy integer.
+    salt: Optional Python `str` supplying auxiliary entropy; see above.
+      Default value: `None` (i.e., no salt).
+    name: Python `str` name prefixed to Ops created by this function.
+      Default value: `None` (i.e., 'sanitize_seed').
+
+  Returns:
+    seed: An integer `Tensor` of shape `[2]` and dtype `SEED_DTYPE`. In JAX, a
+      `PRNGKey`; one passed in as `seed` is returned as is (but for the salt),
+      without checking its dtype or shape.
+
+  Raises:
+    TypeError: if a `Tensor` `seed` does not have an integer dtype.
+    ValueError: if a `Tensor` `seed` does not have shape `[2]`.
+    ValueError: if `seed` is `None` in JAX.
+  """
+  with tf.name_scope(name or 'sanitize_seed'):
+    if isinstance(seed, np.integer):
+      seed = int(seed)
+    if salt is not None and isinstance(seed, six.integer_types):
+      seed = _hash_with_salt(seed, salt)
+    if JAX_MODE:
+      if seed is None:
+        raise ValueError('Must provide a PRNGKey or integer seed in JAX.')
+      import jax.random as jaxrand  # pylint: disable=g-import-not-at-top
+      if isinstance(seed, six.integer_types):
+        return jaxrand.PRNGKey(seed & (2**32 - 1))
+      if salt is not None:
+        return jaxrand.fold_in(seed, _hash_with_salt(0, salt) & (2**32 - 1))
+      return seed
+    if seed is None or isinstance(seed, six.integer_types):
+      return tf.random.uniform(
+          [2], seed=seed,
+          minval=np.iinfo(SEED_DTYPE).min,
+          maxval=np.iinfo(SEED_DTYPE).max,
+          dtype=SEED_DTYPE,
+          name='seed')
+    seed = tf.convert_to_tensor(seed, dtype_hint=SEED_DTYPE, name='seed')
+    if not dtype_util.is_integer(seed.dtype):
+      raise TypeError('Argument `seed` must have integer dtype; got {}.'.format(
+          dtype_util.name(seed.dtype)))
+    if not tensorshape_util.is_compatible_with(seed.shape, [2]):
+      raise ValueError('Argument `seed` must have shape `[2]`; got {}.'.format(
+          seed.shape))
+    return tf.cast(seed, SEED_DTYPE)
+
+
+def _hash_with_salt(seed, salt):
+  """Returns a non-negative Python `int` hashing `seed` together with `salt`."""
+  composite = str((seed, salt)).encode('utf-8')
+  return int(hashlib.sha512(composite).hexdigest(), 16)
@@ -0,0 +1,102 @@
+# Copyright 2019 The TensorFlow Probability Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Tests for samplers."""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+# Dependency imports
+import numpy as np
+import tensorflow.compat.v2 as tf
+
+from tensorflow_probability.python.internal import samplers
+from tensorflow_probability.python.internal import test_util
+
+
+JAX_MODE = False
+
+
+@test_util.test_all_tf_execution_regimes
+class SamplersTest(test_util.TestCase):
+
+  def testSanitizeIntSeed(self):
+    seed = samplers.sanitize_seed(test_util.test_seed())
+    self.assertEqual((2,), seed.shape)
+    self.assertEqual(tf.as_dtype(samplers.SEED_DTYPE), seed.dtype)
+
+  def testSanitizeNumpyIntSeed(self):
+    for seed in (np.int32(5), np.int64(5)):
+      for salt in (None, 'a'):
+        sanitized = samplers.sanitize_seed(seed, salt=salt)
+        self.assertEqual((2,), self.evaluate(sanitized).shape)
+        self.assertEqual(tf.as_dtype(samplers.SEED_DTYPE), sanitized.dtype)
+
+  def testSanitizeNoneSeed(self):
+    if JAX_MODE:
+      with self.assertRaisesRegexp(ValueError, 'Must provide a PRNGKey'):
+        samplers.sanitize_seed(None)
+      return
+    seed = samplers.sanitize_seed(None)
+    self.assertEqual((2,), self.evaluate(seed).shape)
+
+  def testSanitizeTensorSeedPassesThrough(self):
+    seed = samplers.sanitize_seed(tf.constant([3, 4]))
+    self.assertAllEqual([3, 4], self.evaluate(seed))
+
+  def testSanitizeInt64TensorSeed(self):
+    if JAX_MODE:
+      self.skipTest('JAX `PRNGKey`s are passed through unchecked.')
+    seed = samplers.sanitize_seed(tf.constant([3, 4], dtype=tf.int64))
+    self.assertEqual(tf.as_dtype(samplers.SEED_DTYPE), seed.dtype)
+    self.assertAllEqual([3, 4], self.evaluate(seed))
+
+  def testSanitizeTensorSeedWithWrongShapeRaises(self):
+    if JAX_MODE:
+      self.skipTest('JAX `PRNGKey`s are passed through unchecked.')
+    with self.assertRaisesRegexp(ValueError, 'must have shape `\\[2\\]`'):
+      samplers.sanitize_seed(tf.constant(3))
+
+  def testSanitizeFloatTensorSeedRaises(self):
+    if JAX_MODE:
+      self.skipTest('JAX `PRNGKey`s are passed through unchecked.')
+    with self.assertRaisesRegexp(TypeError, 'must have integer dtype'):
+      samplers.sanitize_seed(tf.constant([3., 4.]))
+
+  def testSaltedIntSeedsDiffer(self):
+    seed = test_util.test_seed()
+    seed_1_, seed_2_ = self.evaluate([
+        samplers.sanitize_seed(seed, salt='a'),
+        samplers.sanitize_seed(seed, salt='b')])
+    self.assertNotAllEqual(seed_1_, seed_2_)
+
+  def testSaltLeavesTensorSeedUnchanged(self):
+    seed = samplers.sanitize_seed(tf.constant([3, 4]), salt='a')
+    if JAX_MODE:
+      # A `PRNGKey` has the salt folded in.
+      self.assertNotAllEqual([3, 4], self.evaluate(seed))
+    else:
+      self.assertAllEqual([3, 4], self.evaluate(seed))
+
+  def testStatelessSamplesAreReproducible(self):
+    seed = samplers.sanitize_seed(test_util.test_seed())
+    samples_1, samples_2 = self.evaluate([
+        tf.random.stateless_normal([10], seed=seed),
+        tf.random.stateless_normal([10], seed=seed)])
+    self.assertAllEqual(samples_1, samples_2)
+
+
+if __name__ == '__main__':
+  tf.test.main()